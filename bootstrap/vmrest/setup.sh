@@ -1,11 +1,11 @@
 #!/bin/bash
+set -e
 
-# Generate credentials
-boots secrets set vix-username admin
-boots secrets generate -l 12 -n 1 -s 1 vix-password
-
-USER=$(boots secrets get vix-username)
-PASS=$(boots secrets get vix-password)
+# Generate credentials. The values are taken from what boots reports back
+# rather than spawning additional boots calls to fetch them again.
+USER=admin
+boots -q secret set vix-username "$USER"
+PASS=$(boots secret generate -l 12 -n 1 -s 1 vix-password | jq -er .data.value)
 
 # Setup vmrest
 sudo ./expect.sh "$USER" "$PASS"
\ No newline at end of file
@@ -1,11 +1,12 @@
 package main
 
 import (
-	"fmt"
+	"bufio"
 	"io"
 
 	gcli "github.com/HomeOperations/jmgilman/cli"
 	"github.com/HomeOperations/jmgilman/cli/http"
+	log "github.com/sirupsen/logrus"
 	"github.com/spf13/afero"
 	"github.com/urfave/cli/v2"
 )
@@ -17,6 +18,10 @@ const (
 	flag_image_output       = "output"
 )
 
+// copyBufferSize is the size of the buffer used when writing downloaded images
+// to disk.
+const copyBufferSize = 1024 * 1024
+
 // imageConfig holds dependencies utilized by the image subcommand.
 type imageConfig struct {
 	fs       afero.Fs
@@ -76,6 +81,12 @@ func image(a gcli.App) *cli.Command {
 	}
 }
 
+// writerOnly hides any io.ReaderFrom implementation of the wrapped writer,
+// forcing copies into it to go through a caller supplied buffer.
+type writerOnly struct {
+	io.Writer
+}
+
 // fetchResult is the result from calling fetch().
 type fetchResult struct {
 	Path string `json:"path"`
@@ -92,40 +103,121 @@ func fetch(c *cli.Context, i imageConfig) (fetchResult, error) {
 	if c.IsSet(flag_image_output) {
 		output_file = c.String(flag_image_output)
 	} else {
-		fmt.Println("Value:", c.String(flag_image_output))
 		output_file = filename
 	}
 
-	out, err := i.fs.Create(output_file)
+	if size, ok := cached(i, output_file, channel, arch, filename); ok {
+		log.Info("Existing image is up to date, skipping download")
+		return fetchResult{
+			Path: output_file,
+			Size: size,
+		}, nil
+	}
+
+	// Download to a temporary file which is only moved into place once it has
+	// been fully written and validated, so an interrupted or failed download
+	// never leaves a truncated image behind.
+	part_file := output_file + ".part"
+	size, err := download(i, part_file, channel, arch, filename)
 	if err != nil {
+		i.fs.Remove(part_file)
 		return fetchResult{}, err
 	}
-	defer out.Close()
 
-	data, size, err := i.provider.Fetch(channel, arch, filename)
+	err = i.fs.Rename(part_file, output_file)
 	if err != nil {
+		i.fs.Remove(part_file)
 		return fetchResult{}, err
 	}
+
+	return fetchResult{
+		Path: output_file,
+		Size: size,
+	}, nil
+}
+
+// download writes the specified Container Linux image to the given path,
+// validating its signature along the way, and returns its size.
+func download(i imageConfig, path, channel, arch, filename string) (size int64, err error) {
+	out, err := i.fs.Create(path)
+	if err != nil {
+		return 0, err
+	}
+	defer func() {
+		if cerr := out.Close(); err == nil {
+			err = cerr
+		}
+	}()
+
+	data, size, err := i.provider.Fetch(channel, arch, filename)
+	if err != nil {
+		return 0, err
+	}
 	defer data.Close()
 
-	_, err = io.Copy(out, data)
+	// Reserve the full size of the image up front so the file isn't grown with
+	// every write. The size is unknown when the server doesn't report it.
+	if size > 0 {
+		if err := out.Truncate(size); err != nil {
+			log.WithField("error", err).Debug("Unable to preallocate output file")
+		}
+	}
+
+	// Validate the image while it's being downloaded rather than re-reading it
+	// from disk afterwards. The downloaded data is teed into a pipe which feeds
+	// the signature check running in the background.
+	pr, pw := io.Pipe()
+	validated := make(chan error, 1)
+	go func() {
+		err := i.provider.Validate(pr, channel, arch, filename)
+		pr.CloseWithError(err) // Unblock the download if validation bails early
+		validated <- err
+	}()
+
+	// Coalesce the small reads off the network into large writes to disk
+	buf := bufio.NewWriterSize(writerOnly{out}, copyBufferSize)
+	_, err = io.Copy(buf, io.TeeReader(data, pw))
+	if err == nil {
+		err = buf.Flush()
+	}
+	pw.CloseWithError(err)
 
+	// A failed validation closes the pipe with its error, so any copy error
+	// takes precedence as it's either the root cause or the validation error.
+	verr := <-validated
 	if err != nil {
-		return fetchResult{}, err
+		return 0, err
 	}
 
-	_, err = out.Seek(io.SeekStart, 0) // Reset reader for validation
+	if verr != nil {
+		return 0, verr
+	}
+
+	return size, nil
+}
+
+// cached returns whether the file at the given path is a complete copy of the
+// remote image with a valid signature, along with its size.
+func cached(i imageConfig, path, channel, arch, filename string) (int64, bool) {
+	info, err := i.fs.Stat(path)
 	if err != nil {
-		return fetchResult{}, err
+		return 0, false
 	}
 
-	err = i.provider.Validate(out, channel, arch, filename)
+	size, err := i.provider.Size(channel, arch, filename)
+	if err != nil || size <= 0 || size != info.Size() {
+		return 0, false
+	}
+
+	file, err := i.fs.Open(path)
 	if err != nil {
-		return fetchResult{}, err
+		return 0, false
 	}
+	defer file.Close()
 
-	return fetchResult{
-		Path: output_file,
-		Size: size,
-	}, nil
+	if err := i.provider.Validate(file, channel, arch, filename); err != nil {
+		return 0, false
+	}
+
+	return size, true
 }
@@ -5,6 +5,7 @@ import (
 	"flag"
 	"fmt"
 	"io"
+	"os"
 	"testing"
 
 	"github.com/HomeOperations/jmgilman/cli/mocks"
@@ -78,6 +79,9 @@ func TestFetch(t *testing.T) {
 	is.NoErr(err)
 	is.Equal(string(file_data), "test")
 
+	_, err = cfg.fs.Stat(expected_output_file + ".part")
+	is.True(os.IsNotExist(err))
+
 	// With fetch error
 	cfg = imageConfig{
 		fs: afero.NewMemMapFs(),
@@ -109,4 +113,53 @@ func TestFetch(t *testing.T) {
 
 	_, err = fetch(ctx, cfg)
 	is.Equal(err.Error(), "failed")
+
+	_, err = cfg.fs.Stat(expected_output_file)
+	is.True(os.IsNotExist(err))
+
+	_, err = cfg.fs.Stat(expected_output_file + ".part")
+	is.True(os.IsNotExist(err))
+
+	// With existing image
+	var got_fetched bool
+	cfg = imageConfig{
+		fs: afero.NewMemMapFs(),
+		provider: &mocks.MockImageProvider{
+			FnFetch: func(channel, arch, filename string) (io.ReadCloser, int64, error) {
+				got_fetched = true
+				return nil, 0, fmt.Errorf("failed")
+			},
+			FnSize: func(channel, arch, filename string) (int64, error) {
+				return 4, nil
+			},
+			FnValidate: func(data io.ReadCloser, channel, arch, filename string) error {
+				got_data, _ = io.ReadAll(data)
+				return nil
+			},
+		},
+	}
+	err = afero.WriteFile(cfg.fs, expected_output_file, []byte("test"), 0644)
+	is.NoErr(err)
+
+	result, err = fetch(ctx, cfg)
+	is.NoErr(err)
+	is.True(!got_fetched)
+	is.Equal(string(got_data), "test")
+	is.Equal(result.Path, expected_output_file)
+	is.Equal(result.Size, int64(4))
+
+	// With stale existing image
+	cfg.provider = &mocks.MockImageProvider{
+		FnFetch: func(channel, arch, filename string) (io.ReadCloser, int64, error) {
+			got_fetched = true
+			return nil, 0, fmt.Errorf("failed")
+		},
+		FnSize: func(channel, arch, filename string) (int64, error) {
+			return 8, nil
+		},
+	}
+
+	_, err = fetch(ctx, cfg)
+	is.True(got_fetched)
+	is.Equal(err.Error(), "failed")
 }
@@ -5,13 +5,15 @@ import (
 	"io"
 	"net/http"
 	"strings"
+	"sync"
+	"time"
 
 	gcli "github.com/HomeOperations/jmgilman/cli"
 	log "github.com/sirupsen/logrus"
 	"golang.org/x/crypto/openpgp"
 )
 
-var baseURL string = "https://%s.release.flatcar-linux.net/%s-usr/current/%s"
+const baseURL = "https://%s.release.flatcar-linux.net/%s-usr/current/%s"
 
 // httpClient is an interface for processing HTTP requests and returning HTTP
 // responses.
@@ -36,6 +38,10 @@ type pgpClient interface {
 type ImageProvider struct {
 	httpClient httpClient
 	pgpClient  pgpClient
+
+	keyringOnce sync.Once
+	keyring     openpgp.EntityList
+	keyringErr  error
 }
 
 // openpgpClient implements pgpClient using the openpgp package.
@@ -55,11 +61,25 @@ func (i *ImageProvider) buildURL(channel string, arch string, filename string) s
 	return fmt.Sprintf(baseURL, channel, arch, filename)
 }
 
+// loadKeyring returns the keyring containing the Flatcar image signing key.
+// The armored key is only parsed on the first call and the result is reused.
+func (i *ImageProvider) loadKeyring() (openpgp.EntityList, error) {
+	i.keyringOnce.Do(func() {
+		i.keyring, i.keyringErr = i.pgpClient.ReadArmoredKeyRing(strings.NewReader(publicKey))
+	})
+
+	return i.keyring, i.keyringErr
+}
+
 // download downloads the remote file at the given URL, returning a stream of
 // data and it's expected size.
 func (i *ImageProvider) download(url string) (io.ReadCloser, int64, error) {
 	log.Info("Sending request to %s", url)
 	req, err := http.NewRequest(http.MethodGet, url, nil)
+	if err != nil {
+		return nil, 0, err
+	}
+
 	resp, err := i.httpClient.Do(req)
 	if err != nil {
 		return nil, 0, err
@@ -77,6 +97,27 @@ func (i *ImageProvider) Fetch(channel, arch, filename string) (io.ReadCloser, in
 	return i.download(i.buildURL(channel, arch, filename))
 }
 
+func (i *ImageProvider) Size(channel, arch, filename string) (int64, error) {
+	url := i.buildURL(channel, arch, filename)
+	log.Infof("Sending HEAD request to %s", url)
+	req, err := http.NewRequest(http.MethodHead, url, nil)
+	if err != nil {
+		return 0, err
+	}
+
+	resp, err := i.httpClient.Do(req)
+	if err != nil {
+		return 0, err
+	}
+	defer resp.Body.Close()
+
+	if resp.StatusCode != http.StatusOK {
+		return 0, fmt.Errorf("unexpected status code: %d", resp.StatusCode)
+	}
+
+	return resp.ContentLength, nil
+}
+
 func (i *ImageProvider) Validate(data io.ReadCloser, channel, arch, filename string) error {
 	log.WithFields(log.Fields{
 		"channel":      channel,
@@ -90,8 +131,9 @@ func (i *ImageProvider) Validate(data io.ReadCloser, channel, arch, filename str
 		log.Error("Error downloading signature file: %s", err)
 		return err
 	}
+	defer sig.Close() // Return the connection to the pool for reuse
 
-	keyring, err := i.pgpClient.ReadArmoredKeyRing(strings.NewReader(publicKey))
+	keyring, err := i.loadKeyring()
 	if err != nil {
 		log.Error("Error parsing PGP public key: %s", err)
 		return err
@@ -106,9 +148,23 @@ func (i *ImageProvider) Validate(data io.ReadCloser, channel, arch, filename str
 	return nil
 }
 
+// newHTTPClient returns an http.Client suited to downloading large images. It
+// uses its own keep-alive pool with HTTP/2 enabled and bounds the time taken
+// to connect and receive response headers, but not to read the body since
+// images can take a long time to download.
+func newHTTPClient() *http.Client {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.ForceAttemptHTTP2 = true
+	transport.ResponseHeaderTimeout = 30 * time.Second
+
+	return &http.Client{
+		Transport: transport,
+	}
+}
+
 func NewImageProvider() gcli.ImageProvider {
 	return &ImageProvider{
-		httpClient: &http.Client{},
+		httpClient: newHTTPClient(),
 		pgpClient:  &openpgpClient{},
 	}
 }
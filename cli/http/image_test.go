@@ -34,6 +34,16 @@ func (m *MockPGPClient) CheckDetachedSignature(keyring openpgp.KeyRing, signed i
 	return m.fnCheckDetachedSignature(keyring, signed, signature)
 }
 
+type mockBody struct {
+	io.Reader
+	closed *bool
+}
+
+func (m *mockBody) Close() error {
+	*m.closed = true
+	return nil
+}
+
 func TestBuildURL(t *testing.T) {
 	is := is.New(t)
 	expected := fmt.Sprintf(baseURL, "alpha", "arm64", "flatcar_production_image.bin.bz2")
@@ -111,6 +121,47 @@ func TestFetch(t *testing.T) {
 	is.Equal(expected_url, got_url)
 }
 
+func TestSize(t *testing.T) {
+	is := is.New(t)
+	expected_url := fmt.Sprintf(baseURL, "alpha", "arm64", "flatcar_production_image.bin.bz2")
+	expected_size := int64(1024)
+
+	// With no error
+	var got_method string
+	var got_url string
+	mock := MockHTTPClient{
+		fnDo: func(req *http.Request) (*http.Response, error) {
+			got_method = req.Method
+			got_url = req.URL.String()
+			return &http.Response{
+				Body:          io.NopCloser(strings.NewReader("")),
+				ContentLength: expected_size,
+				StatusCode:    http.StatusOK,
+			}, nil
+		},
+	}
+
+	fetcher := ImageProvider{
+		httpClient: &mock,
+	}
+	size, err := fetcher.Size("alpha", "arm64", "flatcar_production_image.bin.bz2")
+	is.NoErr(err)
+	is.Equal(http.MethodHead, got_method)
+	is.Equal(expected_url, got_url)
+	is.Equal(expected_size, size)
+
+	// With bad status
+	mock.fnDo = func(req *http.Request) (*http.Response, error) {
+		return &http.Response{
+			Body:       io.NopCloser(strings.NewReader("")),
+			StatusCode: http.StatusNotFound,
+		}, nil
+	}
+
+	_, err = fetcher.Size("alpha", "arm64", "flatcar_production_image.bin.bz2")
+	is.True(err != nil)
+}
+
 func TestValidate(t *testing.T) {
 	is := is.New(t)
 	expected_url := fmt.Sprintf("%s.sig", fmt.Sprintf(baseURL, "alpha", "arm64", "flatcar_production_image.bin.bz2"))
@@ -119,11 +170,15 @@ func TestValidate(t *testing.T) {
 	expected_sig_data := "testsignature"
 
 	var got_url string
+	var got_closed bool
 	mock_http := MockHTTPClient{
 		fnDo: func(req *http.Request) (*http.Response, error) {
 			got_url = req.URL.String()
 			return &http.Response{
-				Body: io.NopCloser(strings.NewReader(expected_sig_data)),
+				Body: &mockBody{
+					Reader: strings.NewReader(expected_sig_data),
+					closed: &got_closed,
+				},
 			}, nil
 		},
 	}
@@ -159,6 +214,7 @@ func TestValidate(t *testing.T) {
 	is.Equal(expected_pub_key, got_pub_key)
 	is.Equal(expected_data, got_data)
 	is.Equal(expected_sig_data, got_sig_data)
+	is.True(got_closed)
 
 	// With failed validation
 	mock_pgp.fnCheckDetachedSignature = func(keyring openpgp.KeyRing, signed, signature io.Reader) (signer *openpgp.Entity, err error) {
@@ -171,4 +227,26 @@ func TestValidate(t *testing.T) {
 	}
 	err = fetcher.Validate(io.NopCloser(strings.NewReader(expected_data)), "alpha", "arm64", "flatcar_production_image.bin.bz2")
 	is.True(errors.Is(err, gcli.ErrSigCheckFailed))
+
+	// With repeated validations
+	var got_reads int
+	mock_pgp = MockPGPClient{
+		fnReadArmoredKeyRing: func(r io.Reader) (openpgp.EntityList, error) {
+			got_reads++
+			return openpgp.EntityList{}, nil
+		},
+		fnCheckDetachedSignature: func(keyring openpgp.KeyRing, signed, signature io.Reader) (signer *openpgp.Entity, err error) {
+			return nil, nil
+		},
+	}
+
+	fetcher = ImageProvider{
+		httpClient: &mock_http,
+		pgpClient:  &mock_pgp,
+	}
+	for n := 0; n < 2; n++ {
+		err = fetcher.Validate(io.NopCloser(strings.NewReader(expected_data)), "alpha", "arm64", "flatcar_production_image.bin.bz2")
+		is.NoErr(err)
+	}
+	is.Equal(got_reads, 1)
 }
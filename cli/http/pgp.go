@@ -1,7 +1,7 @@
 package http
 
 // https://www.flatcar-linux.org/security/image-signing-key
-var publicKey string = `
+const publicKey = `
 -----BEGIN PGP PUBLIC KEY BLOCK-----
 
 mQINBFqUFawBEACdnSVBBSx3negnGv7Ppf2D6fbIQAHSzUQ+BA5zEG02BS6EKbJh
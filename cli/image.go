@@ -12,6 +12,10 @@ type ImageProvider interface {
 	// Container Linux image at the given channel for the given architecture.
 	Fetch(channel, arch, filename string) (io.ReadCloser, int64, error)
 
+	// Size returns the size in bytes of the production Container Linux image at
+	// the given channel for the given architecture without downloading it.
+	Size(channel, arch, filename string) (int64, error)
+
 	// Validate takes a stream containing a Container Linux image and validates it
 	// against the remote PGP signature for the given channel and architecture.
 	Validate(data io.ReadCloser, channel, arch, filename string) error
@@ -4,6 +4,7 @@ import "io"
 
 type MockImageProvider struct {
 	FnFetch    func(channel, arch, filename string) (io.ReadCloser, int64, error)
+	FnSize     func(channel, arch, filename string) (int64, error)
 	FnValidate func(data io.ReadCloser, channel, arch, filename string) error
 }
 
@@ -11,6 +12,10 @@ func (m *MockImageProvider) Fetch(channel, arch, filename string) (io.ReadCloser
 	return m.FnFetch(channel, arch, filename)
 }
 
+func (m *MockImageProvider) Size(channel, arch, filename string) (int64, error) {
+	return m.FnSize(channel, arch, filename)
+}
+
 func (m *MockImageProvider) Validate(data io.ReadCloser, channel, arch, filename string) error {
 	return m.FnValidate(data, channel, arch, filename)
 }
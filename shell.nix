@@ -12,6 +12,7 @@ pkgs.mkShell {
   buildInputs = [
     boots
     pkgs.consul
+    pkgs.jq
     pkgs.nomad
     pkgs.vault
     pkgs.vagrant